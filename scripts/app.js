@@ -270,7 +270,227 @@
     return feature;
   }
 
-  const worldFeatures = WORLD_GEOJSON.features
+  // Binary world geometry generated by tools/geojson_to_bin.py (used when data/world-geojson.js is not included).
+  // The coordinates stay in typed arrays; features only carry their polygon range and are streamed into
+  // projection.stream() when drawn, so no per-vertex arrays are allocated.
+  const WORLD_GEOMETRY_URL = "data/world-geometry.bin";
+  const GEOMETRY_ARRAY_TYPES = {
+    float32: Float32Array,
+    int16: Int16Array,
+    int32: Int32Array,
+    uint32: Uint32Array
+  };
+
+  async function loadWorldGeometry(url) {
+    const res = await fetch(url);
+    if (!res.ok) throw new Error(`Geometrie konnte nicht geladen werden (${res.status})`);
+    const buffer = await res.arrayBuffer();
+    const preamble = new DataView(buffer, 0, 12);
+    const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+    if (magic !== "FMGB" || preamble.getUint16(4, true) !== 1) {
+      throw new Error("Unbekanntes Geometrieformat");
+    }
+    const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 12, preamble.getUint32(8, true))));
+    const views = {};
+    Object.entries(header.buffers).forEach(([name, spec]) => {
+      views[name] = new GEOMETRY_ARRAY_TYPES[spec.type](buffer, spec.offset, spec.length);
+    });
+    const geometry = {
+      ...views,
+      scale: header.transform?.scale || [1, 1],
+      translate: header.transform?.translate || [0, 0]
+    };
+
+    const features = header.features.map((entry) => {
+      const feature = {
+        type: "Feature",
+        id: entry.id,
+        properties: entry.properties || {},
+        binary: { geometry, polygons: entry.polygons, reversed: false }
+      };
+      // Same rule as normalizeFeatureOrientation: rings covering more than a hemisphere are flipped.
+      const area = binaryFeatureArea(feature);
+      feature.binary.reversed = Number.isFinite(area) && area > 2 * Math.PI;
+      return feature;
+    });
+    return { type: "FeatureCollection", features };
+  }
+
+  // Mirrors d3's polygon streaming: the closing vertex of each ring is not emitted.
+  function streamBinaryFeature(feature, stream) {
+    const { geometry, polygons, reversed } = feature.binary;
+    const { coordinates, ringOffsets, polygonOffsets } = geometry;
+    const [sx, sy] = geometry.scale;
+    const [tx, ty] = geometry.translate;
+    for (let p = polygons[0]; p < polygons[1]; p += 1) {
+      stream.polygonStart();
+      for (let r = polygonOffsets[p]; r < polygonOffsets[p + 1]; r += 1) {
+        const start = ringOffsets[r];
+        const end = ringOffsets[r + 1];
+        stream.lineStart();
+        if (reversed) {
+          for (let i = end - 1; i > start; i -= 1) stream.point(coordinates[2 * i] * sx + tx, coordinates[2 * i + 1] * sy + ty);
+        } else {
+          for (let i = start; i < end - 1; i += 1) stream.point(coordinates[2 * i] * sx + tx, coordinates[2 * i + 1] * sy + ty);
+        }
+        stream.lineEnd();
+      }
+      stream.polygonEnd();
+    }
+  }
+
+  // Spherical area as computed by d3.geoArea, fed from the binary stream.
+  function binaryFeatureArea(feature) {
+    const quarterPi = Math.PI / 4;
+    const radians = Math.PI / 180;
+    let areaSum = 0;
+    let ringSum = 0;
+    let lambda00, phi00, lambda0, cosPhi0, sinPhi0, first;
+    const addPoint = (lambda, phi) => {
+      lambda *= radians;
+      phi = (phi * radians) / 2 + quarterPi;
+      const dLambda = lambda - lambda0;
+      const sdLambda = dLambda >= 0 ? 1 : -1;
+      const adLambda = sdLambda * dLambda;
+      const cosPhi = Math.cos(phi);
+      const sinPhi = Math.sin(phi);
+      const k = sinPhi0 * sinPhi;
+      ringSum += Math.atan2(k * sdLambda * Math.sin(adLambda), cosPhi0 * cosPhi + k * Math.cos(adLambda));
+      lambda0 = lambda;
+      cosPhi0 = cosPhi;
+      sinPhi0 = sinPhi;
+    };
+    streamBinaryFeature(feature, {
+      polygonStart() {
+        ringSum = 0;
+      },
+      polygonEnd() {
+        areaSum += ringSum < 0 ? 2 * Math.PI + ringSum : ringSum;
+      },
+      lineStart() {
+        first = true;
+      },
+      lineEnd() {
+        if (!first) addPoint(lambda00, phi00);
+      },
+      point(lambda, phi) {
+        if (first) {
+          first = false;
+          lambda00 = lambda;
+          phi00 = phi;
+          lambda0 = lambda * radians;
+          phi = (phi * radians) / 2 + quarterPi;
+          cosPhi0 = Math.cos(phi);
+          sinPhi0 = Math.sin(phi);
+        } else {
+          addPoint(lambda, phi);
+        }
+      }
+    });
+    return areaSum * 2;
+  }
+
+  // Projected path sink with the same semantics as d3.geoPath's string renderer (3 digits precision).
+  const roundPathValue = (value) => Math.round(value * 1000) / 1000;
+  const binaryPathSink = {
+    path: "",
+    line: NaN,
+    pointIndex: NaN,
+    polygonStart() {
+      this.line = 0;
+    },
+    polygonEnd() {
+      this.line = NaN;
+    },
+    lineStart() {
+      this.pointIndex = 0;
+    },
+    lineEnd() {
+      if (this.line === 0) this.path += "Z";
+      this.pointIndex = NaN;
+    },
+    point(x, y) {
+      this.path += `${this.pointIndex === 0 ? "M" : "L"}${roundPathValue(x)},${roundPathValue(y)}`;
+      this.pointIndex = 1;
+    },
+    sphere() {}
+  };
+
+  const binaryBoundsSink = {
+    bounds: null,
+    polygonStart() {},
+    polygonEnd() {},
+    lineStart() {},
+    lineEnd() {},
+    sphere() {},
+    point(x, y) {
+      const b = this.bounds;
+      if (x < b[0][0]) b[0][0] = x;
+      if (x > b[1][0]) b[1][0] = x;
+      if (y < b[0][1]) b[0][1] = y;
+      if (y > b[1][1]) b[1][1] = y;
+    }
+  };
+
+  function featurePath(feature) {
+    if (!feature.binary) return geoPath(feature);
+    binaryPathSink.path = "";
+    streamBinaryFeature(feature, projection.stream(binaryPathSink));
+    return binaryPathSink.path || null;
+  }
+
+  function collectionBounds(collection) {
+    if (!collection.features.some((feature) => feature.binary)) return geoPath.bounds(collection);
+    binaryBoundsSink.bounds = [
+      [Infinity, Infinity],
+      [-Infinity, -Infinity]
+    ];
+    const stream = projection.stream(binaryBoundsSink);
+    collection.features.forEach((feature) => streamBinaryFeature(feature, stream));
+    return binaryBoundsSink.bounds;
+  }
+
+  // Equivalent of projection.fitExtent() for collections that may contain binary features.
+  function fitProjectionExtent(extent, collection) {
+    if (!collection.features.some((feature) => feature.binary)) {
+      projection.fitExtent(extent, collection);
+      return;
+    }
+    const clip = projection.clipExtent();
+    projection.scale(150).translate([0, 0]);
+    if (clip != null) projection.clipExtent(null);
+    const b = collectionBounds(collection);
+    const w = extent[1][0] - extent[0][0];
+    const h = extent[1][1] - extent[0][1];
+    const k = Math.min(w / (b[1][0] - b[0][0]), h / (b[1][1] - b[0][1]));
+    const x = +extent[0][0] + (w - k * (b[1][0] + b[0][0])) / 2;
+    const y = +extent[0][1] + (h - k * (b[1][1] + b[0][1])) / 2;
+    projection.scale(150 * k).translate([x, y]);
+    if (clip != null) projection.clipExtent(clip);
+  }
+
+  function showMapError(message) {
+    const error = document.createElement("div");
+    error.className = "map-error";
+    error.setAttribute("role", "alert");
+    error.textContent = message;
+    mapContainer.appendChild(error);
+  }
+
+  let worldGeoJson = typeof WORLD_GEOJSON !== "undefined" ? WORLD_GEOJSON : null;
+  if (!worldGeoJson) {
+    try {
+      worldGeoJson = await loadWorldGeometry(WORLD_GEOMETRY_URL);
+    } catch (error) {
+      console.warn("Weltkarte konnte nicht geladen werden", error);
+      showMapError(
+        "Die Weltkarte konnte nicht geladen werden. Bitte die Seite über einen Webserver öffnen oder data/world-geojson.js einbinden."
+      );
+      return;
+    }
+  }
+
+  const worldFeatures = worldGeoJson.features
     .filter((feature) => feature.id !== "ATA")
     .map(normalizeFeatureOrientation);
   const worldView = { type: "FeatureCollection", features: worldFeatures };
@@ -286,7 +506,7 @@
     height = mapContainer.clientHeight || mapContainer.offsetHeight || 600;
     svg.attr("width", width).attr("height", height);
 
-    projection.fitExtent(
+    fitProjectionExtent(
       [
         [40, 40],
         [width - 40, height - 40]
@@ -297,7 +517,7 @@
     backgroundRect.attr("width", width).attr("height", height).attr("x", 0).attr("y", 0);
     clipPathRect.attr("width", width).attr("height", height).attr("x", 0).attr("y", 0);
 
-    const bounds = geoPath.bounds(worldView);
+    const bounds = collectionBounds(worldView);
     if (bounds && bounds.length === 2) {
       const padding = 20;
       const [[x0, y0], [x1, y1]] = bounds;
@@ -314,7 +534,7 @@
       }
     }
 
-    countriesLayer.selectAll("path").attr("d", geoPath);
+    countriesLayer.selectAll("path").attr("d", featurePath);
     updatePointPositions();
     svg.call(zoom.transform, currentTransform);
   }
@@ -326,14 +546,14 @@
       .enter()
       .append("path")
       .attr("class", "country")
-      .attr("d", geoPath)
+      .attr("d", featurePath)
       .on("mousemove", handleMouseMove)
       .on("mouseleave", handleMouseLeave)
       .on("click", handleCountryClick);
 
     countrySelection.exit().remove();
 
-    countrySelection.merge(entered).attr("d", geoPath);
+    countrySelection.merge(entered).attr("d", featurePath);
     updateCountryClasses();
     updateStrokeWidths();
   }
@@ -466,7 +686,7 @@
   }
 
   function zoomToCollection(collection, animate = true) {
-    const bounds = geoPath.bounds(collection);
+    const bounds = collectionBounds(collection);
     const dx = bounds[1][0] - bounds[0][0];
     const dy = bounds[1][1] - bounds[0][1];
     const x = (bounds[0][0] + bounds[1][0]) / 2;
@@ -926,6 +1146,17 @@
       return;
     }
 
+    if (point.detailStatus === "loading" || point.detailStatus === "error") {
+      const message = document.createElement("div");
+      message.className = point.detailStatus === "loading" ? "no-data detail-loading" : "no-data detail-error";
+      message.textContent =
+        point.detailStatus === "loading"
+          ? "Daten werden geladen …"
+          : "Detaildaten konnten nicht geladen werden. Bitte den Marker erneut öffnen.";
+      panelBody.appendChild(message);
+      return;
+    }
+
     let dataset;
     if (state.selectedOrg === "CVS vs RVS") {
       dataset = point.data?.compare;
@@ -966,6 +1197,47 @@
     }
   }
 
+  // Detail buckets (generated with --split-details) are loaded on demand via <script>, so file:// keeps working.
+  const detailBucketRequests = new Map();
+
+  function loadDetailBucket(bucket) {
+    if (!detailBucketRequests.has(bucket)) {
+      const request = new Promise((resolve, reject) => {
+        const script = document.createElement("script");
+        script.src = `${DETAIL_INDEX.baseUrl}${bucket}.js`;
+        script.onload = () => resolve(window.DETAIL_BUCKETS?.[bucket] || {});
+        script.onerror = () => {
+          detailBucketRequests.delete(bucket);
+          reject(new Error(`Detail-Bucket ${bucket} konnte nicht geladen werden`));
+        };
+        document.head.appendChild(script);
+      });
+      detailBucketRequests.set(bucket, request);
+    }
+    return detailBucketRequests.get(bucket);
+  }
+
+  // Returns null when nothing has to be loaded. Otherwise sets point.detailStatus to "loading"
+  // synchronously and returns a promise that settles once the bucket is loaded ("error" on failure).
+  function ensurePointDetails(point) {
+    if (typeof DETAIL_INDEX === "undefined" || point.data || point.comingSoon) return null;
+    const bucket = DETAIL_INDEX.points?.[point.id];
+    if (!bucket) return null;
+    point.detailStatus = "loading";
+    return loadPointDetails(point, bucket);
+  }
+
+  async function loadPointDetails(point, bucket) {
+    try {
+      const records = await loadDetailBucket(bucket);
+      point.data = records[point.id];
+      point.detailStatus = point.data ? null : "error";
+    } catch (err) {
+      console.warn("Detaildaten konnten nicht geladen werden", err);
+      point.detailStatus = "error";
+    }
+  }
+
   function openDetailPanel(point, countryConfig) {
     highlightSelectedPoint(point.id);
     state.selectedOrg = ORG_OPTIONS[0];
@@ -974,11 +1246,20 @@
     const category = DATA_CONFIG.categories[point.category];
     panelSubtitle.textContent = `${countryConfig?.name || ""} · ${category?.label || ""}`;
 
+    const details = ensurePointDetails(point);
     renderOrgSelector(point);
     updatePanelContent(point);
 
     detailPanel.classList.add("is-visible");
     detailPanel.setAttribute("aria-hidden", "false");
+
+    if (details) {
+      details.then(() => {
+        if (state.selectedPoint === point.id) {
+          updatePanelContent(point);
+        }
+      });
+    }
   }
 
   function hideDetailPanel() {
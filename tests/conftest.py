@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# Die Werkzeuge in tools/ importieren sich gegenseitig über ihren Modulnamen,
+# genau wie beim Aufruf als Skript.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
@@ -0,0 +1,81 @@
+from collections import OrderedDict
+
+from datajs_archive import (
+    SnapshotStore,
+    archive_build,
+    chunk_points,
+    load_snapshot,
+    main,
+    store_snapshot,
+)
+from xlsx_to_datajs import render_js, split_point_details
+
+
+def make_data(point_ids):
+    points = [
+        {"id": point_id, "title": point_id.upper(), "category": "Finance", "coordinates": [1.0, 2.0], "data": {"Group": None}}
+        for point_id in point_ids
+    ]
+    return {
+        "org_options": ["Group", "CVS vs RVS"],
+        "data_config": OrderedDict([
+            ("categories", OrderedDict([("Finance", {"label": "Finance", "iconId": "poi-finance", "color": "#f6bd60"})])),
+            ("continents", OrderedDict([("Europa", {"countries": ["DEU", "FRA"]})])),
+            ("countries", OrderedDict([
+                ("DEU", {"name": "Deutschland", "continent": "Europa", "active": True, "overview": "", "points": points}),
+                ("FRA", {"name": "Frankreich", "continent": "Europa", "active": False, "overview": "", "points": []}),
+            ])),
+        ]),
+    }
+
+
+def test_store_and_load_reproduce_render_js(tmp_path):
+    data = make_data([f"p{i}" for i in range(30)])
+    store = SnapshotStore(tmp_path)
+    manifest_id = store_snapshot(store, data)
+    assert render_js(load_snapshot(store, manifest_id)) == render_js(data)
+
+
+def test_inserting_a_point_only_rewrites_its_chunk():
+    point_ids = [f"p{i}" for i in range(60)]
+    before = chunk_points(make_data(point_ids)["data_config"]["countries"]["DEU"]["points"])
+    after = chunk_points(make_data(["neu"] + point_ids)["data_config"]["countries"]["DEU"]["points"])
+    assert len([chunk for chunk in after if chunk not in before]) == 1
+
+
+def test_archive_build_skips_unchanged_data(tmp_path):
+    data = make_data(["a", "b"])
+    first, created = archive_build(tmp_path, data, "test")
+    assert created
+    again, created = archive_build(tmp_path, data, "test")
+    assert (again, created) == (first, False)
+    split = {"directory": "scripts/details", "buckets": 2, "baseUrl": "scripts/details/"}
+    split_version, created = archive_build(tmp_path, data, "test", split)
+    assert created and split_version != first
+
+
+def test_restore_command_writes_archived_version(tmp_path):
+    archive = tmp_path / "archive"
+    old = make_data(["a", "b"])
+    archive_build(archive, old, "alt")
+    archive_build(archive, make_data(["a", "b", "c"]), "neu")
+    first_id = SnapshotStore(archive).versions()[0]["id"]
+
+    output = tmp_path / "data.js"
+    assert main(["--archive", str(archive), "restore", first_id[:10], "--output", str(output)]) == 0
+    assert output.read_text(encoding="utf-8") == render_js(old)
+
+
+def test_restore_command_re_splits_split_versions(tmp_path):
+    archive = tmp_path / "archive"
+    details = tmp_path / "details"
+    split = {"directory": details.as_posix(), "buckets": 2, "baseUrl": "scripts/details/"}
+    data = make_data(["a", "b", "c"])
+    archive_build(archive, data, "test", split)
+
+    output = tmp_path / "data.js"
+    assert main(["--archive", str(archive), "restore", "latest", "--output", str(output)]) == 0
+    marker_data, buckets, index = split_point_details(data, 2)
+    expected = render_js(marker_data, {"baseUrl": "scripts/details/", "points": index})
+    assert output.read_text(encoding="utf-8") == expected
+    assert sorted(path.stem for path in details.iterdir()) == sorted(buckets)
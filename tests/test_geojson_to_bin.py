@@ -0,0 +1,65 @@
+import pytest
+
+from geojson_to_bin import ENCODINGS, decode_geometry, encode_geometry, max_deviation, read_header
+
+COLLECTION = {
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "id": "AAA",
+            "properties": {"name": "Polygon mit Loch"},
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [
+                    [[0.0, 0.0], [10.0, 0.0], [10.0, 10.0], [0.0, 10.0], [0.0, 0.0]],
+                    [[2.0, 2.0], [2.0, 4.0], [4.0, 4.0], [2.0, 2.0]],
+                ],
+            },
+        },
+        {
+            "type": "Feature",
+            "id": "BBB",
+            "properties": {"name": "Inseln"},
+            "geometry": {
+                "type": "MultiPolygon",
+                "coordinates": [
+                    [[[-170.5, -45.25], [-160.0, -45.25], [-165.0, -40.0], [-170.5, -45.25]]],
+                    [[[150.0, 60.0], [179.9, 60.0], [179.9, 70.0], [150.0, 60.0]]],
+                ],
+            },
+        },
+    ],
+}
+
+TOLERANCE = {"float32": 1e-4, "int16": 1e-2, "int32": 1e-6}
+
+
+@pytest.mark.parametrize("encoding", sorted(ENCODINGS))
+def test_round_trip(encoding):
+    blob = encode_geometry(COLLECTION, encoding)
+    decoded = decode_geometry(blob)
+
+    assert max_deviation(COLLECTION, decoded) <= TOLERANCE[encoding]
+    assert [feature["geometry"]["type"] for feature in decoded["features"]] == ["Polygon", "MultiPolygon"]
+    assert [feature["properties"] for feature in decoded["features"]] == [
+        feature["properties"] for feature in COLLECTION["features"]
+    ]
+
+
+@pytest.mark.parametrize("encoding", sorted(ENCODINGS))
+def test_header_layout(encoding):
+    blob = encode_geometry(COLLECTION, encoding)
+    header = read_header(blob)
+
+    assert header["encoding"] == encoding
+    assert (header["vertexCount"], header["ringCount"], header["polygonCount"]) == (17, 4, 3)
+    assert [feature["polygons"] for feature in header["features"]] == [[0, 1], [1, 3]]
+    for spec in header["buffers"].values():
+        assert spec["offset"] % 4 == 0
+    assert ("transform" in header) == (encoding != "float32")
+
+
+def test_rejects_unknown_encoding():
+    with pytest.raises(ValueError):
+        encode_geometry(COLLECTION, "float64")
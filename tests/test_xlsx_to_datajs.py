@@ -0,0 +1,79 @@
+from collections import OrderedDict
+
+import pytest
+
+from xlsx_to_datajs import (
+    default_detail_base_url,
+    detail_bucket_name,
+    render_js,
+    split_point_details,
+    write_split_output,
+)
+
+
+def make_data():
+    points = [
+        {"id": "p1", "title": "Eins", "category": "Finance", "coordinates": [1.0, 2.0], "data": {"Group": {"summary": "A"}}},
+        {"id": "p2", "title": "Zwei", "category": "HR", "coordinates": [3.0, 4.0], "comingSoon": True},
+        {"id": "p3", "title": "Drei", "category": "HR", "coordinates": [5.0, 6.0], "data": {"compare": None}},
+    ]
+    return {
+        "org_options": ["Group"],
+        "data_config": OrderedDict([
+            ("categories", OrderedDict()),
+            ("continents", OrderedDict()),
+            ("countries", OrderedDict([("DEU", {"name": "Deutschland", "continent": "Europa", "active": True, "overview": "", "points": points})])),
+        ]),
+    }
+
+
+def test_split_point_details_moves_data_into_buckets():
+    data = make_data()
+    marker_data, buckets, index = split_point_details(data, 4)
+
+    markers = marker_data["data_config"]["countries"]["DEU"]["points"]
+    assert [marker["id"] for marker in markers] == ["p1", "p2", "p3"]
+    assert all("data" not in marker for marker in markers)
+    assert markers[1]["comingSoon"] is True
+
+    assert index == {"p1": detail_bucket_name("p1", 4), "p3": detail_bucket_name("p3", 4)}
+    for point_id, bucket in index.items():
+        assert point_id in buckets[bucket]
+    assert buckets[index["p1"]]["p1"] == {"Group": {"summary": "A"}}
+    assert buckets[index["p3"]]["p3"] == {"compare": None}
+
+    # Die Eingabe bleibt unverändert.
+    assert "data" in data["data_config"]["countries"]["DEU"]["points"][0]
+
+
+def test_render_js_with_detail_index():
+    marker_data, _buckets, index = split_point_details(make_data(), 2)
+    content = render_js(marker_data, {"baseUrl": "scripts/details/", "points": index})
+    assert "const DETAIL_INDEX = " in content
+    assert '"data"' not in content
+    assert "DETAIL_INDEX" not in render_js(make_data())
+
+
+def test_default_detail_base_url_is_relative_to_site_root(tmp_path):
+    output = tmp_path / "site" / "scripts" / "data.js"
+    assert default_detail_base_url(tmp_path / "site" / "scripts" / "details", output) == "scripts/details/"
+    with pytest.raises(ValueError):
+        default_detail_base_url(tmp_path / "elsewhere", output)
+
+
+def test_write_split_output_keeps_buckets_when_data_js_fails(tmp_path):
+    details = tmp_path / "details"
+    details.mkdir()
+    stale = details / "bucket-99.js"
+    stale.write_text("alt", encoding="utf-8")
+    output = tmp_path / "data.js"
+    output.mkdir()  # data.js kann nicht geschrieben werden
+    split = {"directory": details.as_posix(), "buckets": 4, "baseUrl": "details/"}
+
+    with pytest.raises(OSError):
+        write_split_output(output, make_data(), split)
+    assert [path.name for path in details.iterdir()] == ["bucket-99.js"]
+
+    output.rmdir()
+    assert write_split_output(output, make_data(), split) == (2, len(list(details.iterdir())))
+    assert not stale.exists()
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""Inhaltsadressiertes Archiv veröffentlichter `scripts/data.js`-Stände.
+
+Beispielaufrufe:
+    python tools/xlsx_to_datajs.py --xlsx data/data-source.xlsx --output scripts/data.js --archive data/archive
+    python tools/datajs_archive.py --archive data/archive list
+    python tools/datajs_archive.py --archive data/archive restore 3f2a9c --output scripts/data.js
+
+Jeder Stand wird in Blöcke zerlegt: Kategorien, Kontinente, Organisationsliste,
+je Land die Metadaten sowie die Marker in Blöcken von durchschnittlich
+`POINT_CHUNK_SIZE` Einträgen. Die Blockgrenzen ergeben sich aus den Marker-IDs
+(siehe `chunk_points`), daher verändert ein eingefügter oder entfernter Marker
+nur den Block, in dem er liegt. Jeder Block liegt unter dem SHA-256 seines
+Inhalts in `objects/`. Unveränderte Blöcke werden zwischen Versionen geteilt;
+ein neuer Stand kostet daher nur Speicher für die geänderten Länder bzw.
+Markerblöcke. Die Version selbst ist der Hash aus Manifest und den Parametern
+von `--split-details` und wird in `versions.jsonl` protokolliert.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from xlsx_to_datajs import log, render_js, write_output, write_split_output
+
+POINT_CHUNK_SIZE = 8
+VERSIONS_FILE = "versions.jsonl"
+OBJECTS_DIR = "objects"
+
+
+class SnapshotStore:
+    """Ablage für Blöcke und Versionen unterhalb eines Archivverzeichnisses."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.objects_dir = root / OBJECTS_DIR
+        self.versions_path = root / VERSIONS_FILE
+        self.written_objects = 0
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def put(self, value: Any) -> str:
+        # Die Schlüsselreihenfolge bleibt erhalten, da sie die Darstellung in der Karte bestimmt.
+        payload = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(payload).hexdigest()
+        path = self.object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_name(f"{path.name}.tmp")
+            temp_path.write_bytes(zlib.compress(payload, 9))
+            os.replace(temp_path, path)
+            self.written_objects += 1
+        return digest
+
+    def get(self, digest: str) -> Any:
+        path = self.object_path(digest)
+        if not path.exists():
+            raise ValueError(f"Objekt {digest} fehlt im Archiv")
+        payload = zlib.decompress(path.read_bytes())
+        if hashlib.sha256(payload).hexdigest() != digest:
+            raise ValueError(f"Objekt {digest} ist beschädigt (Prüfsumme stimmt nicht)")
+        return json.loads(payload.decode("utf-8"), object_pairs_hook=OrderedDict)
+
+    def versions(self) -> List[Dict[str, Any]]:
+        if not self.versions_path.exists():
+            return []
+        with self.versions_path.open("r", encoding="utf-8") as handle:
+            return [json.loads(line) for line in handle if line.strip()]
+
+    def append_version(self, entry: Dict[str, Any]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        with self.versions_path.open("a", encoding="utf-8", newline="\n") as handle:
+            handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def resolve(self, reference: str) -> str:
+        """Löst `latest` oder ein (gekürztes) Versionskennzeichen zur vollständigen ID auf."""
+
+        versions = self.versions()
+        if not versions:
+            raise ValueError(f"Archiv '{self.root}' enthält keine Versionen")
+        if reference == "latest":
+            return versions[-1]["id"]
+        matches = sorted({entry["id"] for entry in versions if entry["id"].startswith(reference)})
+        if not matches:
+            raise ValueError(f"Version '{reference}' nicht gefunden")
+        if len(matches) > 1:
+            raise ValueError(f"Version '{reference}' ist mehrdeutig ({len(matches)} Treffer)")
+        return matches[0]
+
+
+def chunk_points(points: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """Teilt Marker inhaltsabhängig in Blöcke.
+
+    Ein Block endet nach jedem Marker, dessen ID-Prüfsumme durch
+    `POINT_CHUNK_SIZE` teilbar ist. Die Grenzen hängen damit nur von den
+    Markern selbst ab und nicht von ihrer Position in der Liste.
+    """
+
+    chunks: List[List[Dict[str, Any]]] = []
+    current: List[Dict[str, Any]] = []
+    for point in points:
+        current.append(point)
+        if zlib.crc32(str(point["id"]).encode("utf-8")) % POINT_CHUNK_SIZE == 0:
+            chunks.append(current)
+            current = []
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def store_snapshot(store: SnapshotStore, data: Dict[str, Any]) -> str:
+    """Legt `org_options` und `data_config` blockweise ab und gibt die Manifest-ID zurück."""
+
+    data_config = data["data_config"]
+    countries: List[List[str]] = []
+    for iso_code, country in data_config["countries"].items():
+        meta = OrderedDict((key, value) for key, value in country.items() if key != "points")
+        point_chunks = [store.put(chunk) for chunk in chunk_points(country.get("points", []))]
+        countries.append([iso_code, store.put({"meta": store.put(meta), "points": point_chunks})])
+
+    manifest = OrderedDict([
+        ("orgOptions", store.put(data["org_options"])),
+        ("categories", store.put(data_config["categories"])),
+        ("continents", store.put(data_config["continents"])),
+        ("countries", countries),
+    ])
+    return store.put(manifest)
+
+
+def load_snapshot(store: SnapshotStore, manifest_id: str) -> Dict[str, Any]:
+    """Setzt ein archiviertes Manifest wieder zur Struktur aus `build_data` zusammen."""
+
+    manifest = store.get(manifest_id)
+    countries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+    for iso_code, country_digest in manifest["countries"]:
+        tree = store.get(country_digest)
+        country = store.get(tree["meta"])
+        country["points"] = [point for chunk in tree["points"] for point in store.get(chunk)]
+        countries[iso_code] = country
+    return {
+        "org_options": store.get(manifest["orgOptions"]),
+        "data_config": OrderedDict([
+            ("categories", store.get(manifest["categories"])),
+            ("continents", store.get(manifest["continents"])),
+            ("countries", countries),
+        ]),
+    }
+
+
+def archive_build(
+    root: Path,
+    data: Dict[str, Any],
+    source: str,
+    split: Optional[Dict[str, Any]] = None,
+) -> Tuple[str, bool]:
+    """Archiviert einen erfolgreichen Build; liefert Version und ob sie neu angelegt wurde.
+
+    `split` sind die Parameter von `--split-details` (siehe `write_split_output`).
+    Die Version ist der Hash aus Manifest und `split`, damit `restore` genau die
+    veröffentlichte Ausgabe erzeugt.
+    """
+
+    store = SnapshotStore(root)
+    manifest_id = store_snapshot(store, data)
+    version_id = store.put(OrderedDict([("manifest", manifest_id), ("split", split)]))
+    versions = store.versions()
+    if versions and versions[-1]["id"] == version_id:
+        return version_id, False
+    entry: Dict[str, Any] = {
+        "id": version_id,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "source": source,
+        "countries": len(data["data_config"]["countries"]),
+        "points": sum(len(country["points"]) for country in data["data_config"]["countries"].values()),
+        "newObjects": store.written_objects,
+    }
+    if split:
+        entry["split"] = split
+    store.append_version(entry)
+    return version_id, True
+
+
+def command_list(store: SnapshotStore, _args: argparse.Namespace) -> int:
+    versions = store.versions()
+    if not versions:
+        log("INFO", f"Archiv '{store.root}' enthält keine Versionen.")
+        return 0
+    for entry in reversed(versions):
+        print(
+            f"{entry['id'][:12]}  {entry['created']}  {entry['points']:>4} Marker  "
+            f"{entry['newObjects']:>4} neue Objekte  {'geteilt' if entry.get('split') else 'komplett':<8}  "
+            f"{entry.get('source', '')}"
+        )
+    return 0
+
+
+def command_restore(store: SnapshotStore, args: argparse.Namespace) -> int:
+    try:
+        version_id = store.resolve(args.version)
+        version = store.get(version_id)
+        data = load_snapshot(store, version["manifest"])
+    except ValueError as exc:
+        log("ERROR", str(exc))
+        return 1
+
+    split = None if args.no_split else version["split"]
+    if split and args.split_details:
+        split = {**split, "directory": Path(args.split_details).as_posix()}
+
+    output_path = Path(args.output)
+    try:
+        if split:
+            record_count, bucket_count = write_split_output(output_path, data, split)
+        else:
+            write_output(output_path, render_js(data))
+    except Exception as exc:  # noqa: BLE001
+        log("ERROR", f"Ausgabe konnte nicht geschrieben werden: {exc}")
+        return 3
+
+    if split:
+        log("INFO", f"{record_count} Detaildatensätze in {bucket_count} Buckets unter '{split['directory']}' abgelegt.")
+    log("INFO", f"Version {version_id[:12]} nach '{output_path}' wiederhergestellt.")
+    return 0
+
+
+def parse_arguments(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Verwaltet archivierte Stände von scripts/data.js")
+    parser.add_argument(
+        "--archive",
+        metavar="VERZEICHNIS",
+        default="data/archive",
+        help="Archivverzeichnis (Standard: data/archive)",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    list_parser = subparsers.add_parser("list", help="Archivierte Versionen auflisten (neueste zuerst)")
+    list_parser.set_defaults(handler=command_list)
+    restore_parser = subparsers.add_parser("restore", help="Eine Version als data.js wiederherstellen")
+    restore_parser.add_argument("version", help="Versions-ID, eindeutiges Präfix oder 'latest'")
+    restore_parser.add_argument(
+        "--output",
+        "-o",
+        metavar="DATEI",
+        default="scripts/data.js",
+        help="Zieldatei (Standard: scripts/data.js)",
+    )
+    restore_parser.add_argument(
+        "--split-details",
+        metavar="VERZEICHNIS",
+        help="Detail-Buckets geteilter Versionen in dieses Verzeichnis statt in das archivierte schreiben",
+    )
+    restore_parser.add_argument(
+        "--no-split",
+        action="store_true",
+        help="Geteilte Versionen als vollständige data.js ohne Detail-Buckets wiederherstellen",
+    )
+    restore_parser.set_defaults(handler=command_restore)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_arguments(argv)
+    return args.handler(SnapshotStore(Path(args.archive)), args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
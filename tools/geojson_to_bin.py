@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""Werkzeug zur Umwandlung von `data/world-geojson.js` in ein kompaktes Binärformat.
+
+Beispielaufrufe:
+    python tools/geojson_to_bin.py --input data/world-geojson.js --output data/world-geometry.bin
+    python tools/geojson_to_bin.py --output data/world-geometry.bin --encoding int16 --verify --compare
+
+Statt tausender verschachtelter Koordinaten-Arrays enthält die Ausgabe einen
+flachen Koordinatenpuffer sowie Offset-Arrays für Ringe und Polygone. Die
+Anwendung lädt die Datei als einzelnen ArrayBuffer und legt typisierte Views
+direkt auf die Puffer, ohne Zahlen-Token parsen zu müssen.
+
+Dateiaufbau (Little Endian):
+    0   4 Byte   Magic `FMGB`
+    4   uint16   Formatversion
+    6   uint16   reserviert (0)
+    8   uint32   Länge des JSON-Headers in Byte (inkl. Auffüllung)
+    12  ...      JSON-Header (UTF-8, mit Leerzeichen auf 8 Byte aufgefüllt)
+    ... Puffer   `coordinates`, `ringOffsets`, `polygonOffsets` laut Header
+
+`ringOffsets[i]` ist der Index des ersten Vertex von Ring `i`,
+`polygonOffsets[j]` der Index des ersten Rings von Polygon `j`; beide Arrays
+haben einen abschließenden Endwert. Jedes Feature im Header verweist über
+`polygons: [start, ende)` auf seinen Polygonbereich.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import math
+import struct
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+MAGIC = b"FMGB"
+FORMAT_VERSION = 1
+PREAMBLE = struct.Struct("<4sHHI")
+HEADER_ALIGNMENT = 8
+
+BUFFER_TYPES: Dict[str, str] = {
+    # Typname im Header (entspricht dem JavaScript-TypedArray) → array-Typecode
+    "float32": "f",
+    "int16": "h",
+    "int32": "i",
+    "uint32": "I",
+}
+
+# Kodierung des Koordinatenpuffers → Maximalwert der Quantisierung (0 = unquantisiert)
+ENCODINGS: Dict[str, int] = {
+    "float32": 0,
+    "int16": 2**15 - 1,
+    "int32": 2**31 - 1,
+}
+
+
+def log(level: str, message: str) -> None:
+    """Gibt eine strukturierte Logzeile auf stdout oder stderr aus."""
+
+    level_normalized = level.upper()
+    stream = sys.stderr if level_normalized in {"ERROR", "WARNING"} else sys.stdout
+    print(f"{level_normalized}: {message}", file=stream)
+
+
+def load_geojson_js(path: Path) -> Dict[str, Any]:
+    """Liest eine `const NAME = {...};`-Datei und gibt das enthaltene GeoJSON zurück."""
+
+    text = path.read_text(encoding="utf-8")
+    start = text.find("=")
+    if start < 0:
+        raise ValueError(f"{path} enthält keine JavaScript-Zuweisung")
+    body = text[start + 1:].strip().rstrip(";").strip()
+    data = json.loads(body)
+    if data.get("type") != "FeatureCollection":
+        raise ValueError(f"{path} enthält keine GeoJSON-FeatureCollection")
+    return data
+
+
+def feature_polygons(feature: Dict[str, Any]) -> List[List[List[Sequence[float]]]]:
+    geometry = feature.get("geometry") or {}
+    geometry_type = geometry.get("type")
+    if geometry_type == "Polygon":
+        return [geometry["coordinates"]]
+    if geometry_type == "MultiPolygon":
+        return list(geometry["coordinates"])
+    raise ValueError(f"Feature '{feature.get('id')}' hat nicht unterstützten Geometrietyp {geometry_type!r}")
+
+
+def compute_transform(collection: Dict[str, Any], limit: int) -> Dict[str, List[float]]:
+    """Bestimmt Skalierung und Verschiebung, die die Bounding Box auf [-limit, limit] abbildet."""
+
+    min_x = min_y = math.inf
+    max_x = max_y = -math.inf
+    for feature in collection["features"]:
+        for polygon in feature_polygons(feature):
+            for ring in polygon:
+                for x, y in ring:
+                    min_x, max_x = min(min_x, x), max(max_x, x)
+                    min_y, max_y = min(min_y, y), max(max_y, y)
+    translate = [(min_x + max_x) / 2, (min_y + max_y) / 2]
+    scale = [max((max_x - min_x) / 2 / limit, 1e-12), max((max_y - min_y) / 2 / limit, 1e-12)]
+    return {"scale": scale, "translate": translate}
+
+
+def encode_geometry(collection: Dict[str, Any], encoding: str = "float32") -> bytes:
+    """Serialisiert eine FeatureCollection aus (Multi-)Polygonen in das Binärformat."""
+
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Unbekannte Kodierung '{encoding}' (erlaubt: {', '.join(ENCODINGS)})")
+    limit = ENCODINGS[encoding]
+    transform = compute_transform(collection, limit) if limit else None
+    (sx, sy), (tx, ty) = (transform["scale"], transform["translate"]) if transform else ((1.0, 1.0), (0.0, 0.0))
+
+    coordinates = array(BUFFER_TYPES[encoding])
+    ring_offsets = array("I", [0])
+    polygon_offsets = array("I", [0])
+    features: List[Dict[str, Any]] = []
+
+    for feature in collection["features"]:
+        polygon_start = len(polygon_offsets) - 1
+        for polygon in feature_polygons(feature):
+            for ring in polygon:
+                for x, y in ring:
+                    if transform:
+                        coordinates.append(round((x - tx) / sx))
+                        coordinates.append(round((y - ty) / sy))
+                    else:
+                        coordinates.append(x)
+                        coordinates.append(y)
+                ring_offsets.append(len(coordinates) // 2)
+            polygon_offsets.append(len(ring_offsets) - 1)
+        entry: Dict[str, Any] = {
+            "id": feature.get("id"),
+            "type": feature["geometry"]["type"],
+            "polygons": [polygon_start, len(polygon_offsets) - 1],
+        }
+        if feature.get("properties"):
+            entry["properties"] = feature["properties"]
+        features.append(entry)
+
+    buffers = [
+        ("coordinates", encoding, coordinates),
+        ("ringOffsets", "uint32", ring_offsets),
+        ("polygonOffsets", "uint32", polygon_offsets),
+    ]
+    header: Dict[str, Any] = {
+        "encoding": encoding,
+        "vertexCount": len(coordinates) // 2,
+        "ringCount": len(ring_offsets) - 1,
+        "polygonCount": len(polygon_offsets) - 1,
+        "buffers": {},
+        "features": features,
+    }
+    if transform:
+        header["transform"] = transform
+
+    # Die Pufferpositionen hängen von der Headerlänge ab und umgekehrt. Die
+    # reservierte Länge wächst nur, daher endet die Schleife sicher.
+    header_length = 0
+    while True:
+        offset = PREAMBLE.size + header_length
+        for name, buffer_type, values in buffers:
+            item_size = values.itemsize
+            offset += -offset % item_size
+            header["buffers"][name] = {"offset": offset, "length": len(values), "type": buffer_type}
+            offset += len(values) * item_size
+        header_bytes = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        padded_length = len(header_bytes) + (-(PREAMBLE.size + len(header_bytes)) % HEADER_ALIGNMENT)
+        if padded_length <= header_length:
+            break
+        header_length = padded_length
+
+    output = bytearray(PREAMBLE.pack(MAGIC, FORMAT_VERSION, 0, header_length))
+    output += header_bytes.ljust(header_length, b" ")
+    for name, _buffer_type, values in buffers:
+        output += b"\0" * (header["buffers"][name]["offset"] - len(output))
+        if sys.byteorder != "little":
+            values = array(values.typecode, values)
+            values.byteswap()
+        output += values.tobytes()
+    return bytes(output)
+
+
+def read_header(blob: bytes) -> Dict[str, Any]:
+    magic, version, _reserved, header_length = PREAMBLE.unpack_from(blob, 0)
+    if magic != MAGIC:
+        raise ValueError("Keine Futurmapa-Geometriedatei (Magic stimmt nicht)")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Nicht unterstützte Formatversion {version}")
+    return json.loads(blob[PREAMBLE.size:PREAMBLE.size + header_length].decode("utf-8"))
+
+
+def read_buffers(blob: bytes, header: Dict[str, Any]) -> Dict[str, Sequence[float]]:
+    """Gibt typisierte Views auf die Puffer zurück (ohne Kopie auf Little-Endian-Systemen)."""
+
+    views: Dict[str, Sequence[float]] = {}
+    data = memoryview(blob)
+    for name, spec in header["buffers"].items():
+        typecode = BUFFER_TYPES[spec["type"]]
+        start = spec["offset"]
+        end = start + spec["length"] * array(typecode).itemsize
+        if sys.byteorder == "little":
+            views[name] = data[start:end].cast(typecode)
+        else:
+            values = array(typecode, data[start:end].tobytes())
+            values.byteswap()
+            views[name] = values
+    return views
+
+
+def decode_geometry(blob: bytes) -> Dict[str, Any]:
+    """Baut aus dem Binärformat wieder eine GeoJSON-FeatureCollection auf."""
+
+    header = read_header(blob)
+    views = read_buffers(blob, header)
+    coordinates, ring_offsets, polygon_offsets = (
+        views["coordinates"],
+        views["ringOffsets"],
+        views["polygonOffsets"],
+    )
+    transform = header.get("transform")
+    (sx, sy), (tx, ty) = (transform["scale"], transform["translate"]) if transform else ((1.0, 1.0), (0.0, 0.0))
+
+    def decode_ring(ring_index: int) -> List[List[float]]:
+        start, end = ring_offsets[ring_index], ring_offsets[ring_index + 1]
+        return [
+            [coordinates[2 * i] * sx + tx, coordinates[2 * i + 1] * sy + ty]
+            for i in range(start, end)
+        ]
+
+    features: List[Dict[str, Any]] = []
+    for entry in header["features"]:
+        polygon_start, polygon_end = entry["polygons"]
+        polygons = [
+            [decode_ring(r) for r in range(polygon_offsets[p], polygon_offsets[p + 1])]
+            for p in range(polygon_start, polygon_end)
+        ]
+        geometry_coordinates: Any = polygons[0] if entry["type"] == "Polygon" else polygons
+        feature: Dict[str, Any] = {"type": "Feature"}
+        if entry.get("id") is not None:
+            feature["id"] = entry["id"]
+        feature["properties"] = entry.get("properties", {})
+        feature["geometry"] = {"type": entry["type"], "coordinates": geometry_coordinates}
+        features.append(feature)
+    return {"type": "FeatureCollection", "features": features}
+
+
+def max_deviation(original: Dict[str, Any], decoded: Dict[str, Any]) -> float:
+    """Vergleicht zwei FeatureCollections strukturell und liefert die größte Koordinatenabweichung."""
+
+    if len(original["features"]) != len(decoded["features"]):
+        raise ValueError("Anzahl der Features weicht ab")
+    deviation = 0.0
+    for source, target in zip(original["features"], decoded["features"]):
+        if source.get("id") != target.get("id") or source["geometry"]["type"] != target["geometry"]["type"]:
+            raise ValueError(f"Feature '{source.get('id')}' weicht in ID oder Geometrietyp ab")
+        source_polygons, target_polygons = feature_polygons(source), feature_polygons(target)
+        if [len(ring) for polygon in source_polygons for ring in polygon] != [
+            len(ring) for polygon in target_polygons for ring in polygon
+        ]:
+            raise ValueError(f"Feature '{source.get('id')}' weicht in der Ringstruktur ab")
+        for source_polygon, target_polygon in zip(source_polygons, target_polygons):
+            for source_ring, target_ring in zip(source_polygon, target_polygon):
+                for (x0, y0), (x1, y1) in zip(source_ring, target_ring):
+                    deviation = max(deviation, abs(x0 - x1), abs(y0 - y1))
+    return deviation
+
+
+def write_output(path: Path, content: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+
+
+def best_of(func: Any, repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def report_comparison(source_path: Path, blob: bytes) -> None:
+    source_bytes = source_path.read_bytes()
+    log("INFO", f"Größe {source_path.name}: {len(source_bytes):,} Byte (gzip {len(gzip.compress(source_bytes)):,})")
+    log("INFO", f"Größe Binärformat: {len(blob):,} Byte (gzip {len(gzip.compress(blob)):,})")
+    parse_text = best_of(lambda: load_geojson_js(source_path))
+    parse_views = best_of(lambda: read_buffers(blob, read_header(blob)))
+    parse_full = best_of(lambda: decode_geometry(blob))
+    # Alle Zeiten ohne Zeichnen. app.js liest nur Header und Views und streamt die
+    # Koordinaten beim Zeichnen direkt aus den Puffern; die vollständige Dekodierung
+    # betrifft ausschließlich den Python-Reader.
+    log("INFO", f"Parsen JS/JSON zu GeoJSON: {parse_text * 1000:.2f} ms")
+    log("INFO", f"Binär, Header + Views (Ladeweg von app.js): {parse_views * 1000:.3f} ms")
+    log("INFO", f"Binär, vollständig zu GeoJSON dekodiert (nur Python-Reader): {parse_full * 1000:.2f} ms")
+
+
+def parse_arguments(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Konvertiert data/world-geojson.js in ein binäres Geometrieformat")
+    parser.add_argument(
+        "--input",
+        "-i",
+        metavar="DATEI",
+        default="data/world-geojson.js",
+        help="Quelldatei mit WORLD_GEOJSON (Standard: data/world-geojson.js)",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        metavar="DATEI",
+        required=True,
+        help="Zieldatei (Binärformat)",
+    )
+    parser.add_argument(
+        "--encoding",
+        choices=sorted(ENCODINGS),
+        default="float32",
+        help="Kodierung des Koordinatenpuffers (Standard: float32)",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Ausgabe zurücklesen und mit der Quelle vergleichen",
+    )
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="Dateigrößen und Parse-Zeiten von Quelle und Binärformat ausgeben",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_arguments(argv)
+
+    source_path = Path(args.input)
+    try:
+        collection = load_geojson_js(source_path)
+    except Exception as exc:  # noqa: BLE001
+        log("ERROR", f"Geometrie konnte nicht geladen werden: {exc}")
+        return 2
+
+    try:
+        blob = encode_geometry(collection, args.encoding)
+    except ValueError as exc:
+        log("ERROR", str(exc))
+        return 1
+
+    if args.verify:
+        try:
+            deviation = max_deviation(collection, decode_geometry(blob))
+        except ValueError as exc:
+            log("ERROR", f"Round-Trip fehlgeschlagen: {exc}")
+            return 1
+        log("INFO", f"Round-Trip erfolgreich, maximale Koordinatenabweichung {deviation:.2e}°")
+
+    if args.compare:
+        report_comparison(source_path, blob)
+
+    output_path = Path(args.output)
+    try:
+        write_output(output_path, blob)
+    except Exception as exc:  # noqa: BLE001
+        log("ERROR", f"Ausgabe konnte nicht geschrieben werden: {exc}")
+        return 3
+
+    log("INFO", f"Datei '{output_path}' mit {len(collection['features'])} Features geschrieben.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,10 +4,20 @@
 Beispielaufrufe:
     python tools/xlsx_to_datajs.py --xlsx data/data-source.xlsx --output scripts/data.js
     python tools/xlsx_to_datajs.py --csv-dir data/csv-export --check-only
+    python tools/xlsx_to_datajs.py --xlsx data/data-source.xlsx --output scripts/data.js \
+        --split-details scripts/details
+    python tools/xlsx_to_datajs.py --xlsx data/data-source.xlsx --output scripts/data.js --archive data/archive
 
 Die Eingabe kann eine XLSX-Arbeitsmappe oder ein Verzeichnis mit CSV-
 Exporten der Tabellenblätter sein. Die Ausgabe wird mit zwei Leerzeichen
 Einrückung erzeugt und entspricht der Struktur der bisherigen DATA_CONFIG.
+
+Mit `--split-details` enthält `data.js` nur noch die schlanke Marker-Ebene
+(ID, Titel, Kategorie, Koordinaten). Die Detaildaten je Marker landen in
+Bucket-Dateien, die die Anwendung erst beim Öffnen eines Markers nachlädt.
+
+Mit `--archive` wird jeder erfolgreiche Build zusätzlich im inhaltsadressierten
+Archiv abgelegt (siehe `tools/datajs_archive.py`).
 """
 
 from __future__ import annotations
@@ -15,7 +25,9 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import os
 import sys
+import zlib
 from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -33,6 +45,9 @@ EXPECTED_SHEETS: Sequence[str] = (
     "org_compare",
 )
 
+DETAIL_BUCKET_COUNT_DEFAULT = 16
+DETAIL_BUCKET_PREFIX = "bucket-"
+
 
 def log(level: str, message: str) -> None:
     """Gibt eine strukturierte Logzeile auf stdout oder stderr aus."""
@@ -624,7 +639,50 @@ def build_org_options(organization_order: List[str], compare_blocks: Dict[str, C
     return options
 
 
-def render_js(data: Dict[str, Any]) -> str:
+def detail_bucket_name(point_id: str, bucket_count: int) -> str:
+    """Ordnet eine Marker-ID stabil einem Bucket zu (unabhängig von der Python-Hash-Seed)."""
+
+    width = max(2, len(str(bucket_count - 1)))
+    index = zlib.crc32(point_id.encode("utf-8")) % bucket_count
+    return f"{DETAIL_BUCKET_PREFIX}{index:0{width}d}"
+
+
+def split_point_details(
+    data: Dict[str, Any],
+    bucket_count: int,
+) -> Tuple[Dict[str, Any], "OrderedDict[str, Dict[str, Any]]", Dict[str, str]]:
+    """Trennt die Detaildaten (`data`) der Marker von der Marker-Ebene.
+
+    Liefert die schlanke Kopie der Daten, die Detail-Buckets (Bucket-Name →
+    Marker-ID → Detaildaten) sowie die Zuordnung Marker-ID → Bucket-Name.
+    """
+
+    if bucket_count < 1:
+        raise ValueError("Die Anzahl der Detail-Buckets muss mindestens 1 sein")
+
+    buckets: Dict[str, Dict[str, Any]] = defaultdict(OrderedDict)
+    index: Dict[str, str] = OrderedDict()
+    countries_dict: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+    for iso_code, country in data["data_config"]["countries"].items():
+        marker_points: List[Dict[str, Any]] = []
+        for point in country["points"]:
+            marker = {key: value for key, value in point.items() if key != "data"}
+            if "data" in point:
+                bucket = detail_bucket_name(point["id"], bucket_count)
+                buckets[bucket][point["id"]] = point["data"]
+                index[point["id"]] = bucket
+            marker_points.append(marker)
+        countries_dict[iso_code] = {**country, "points": marker_points}
+
+    marker_data = {
+        "org_options": data["org_options"],
+        "data_config": {**data["data_config"], "countries": countries_dict},
+    }
+    ordered_buckets = OrderedDict((name, buckets[name]) for name in sorted(buckets))
+    return marker_data, ordered_buckets, index
+
+
+def render_js(data: Dict[str, Any], detail_index: Optional[Dict[str, Any]] = None) -> str:
     org_options_json = json.dumps(data["org_options"], ensure_ascii=False, indent=2)
     data_config_json = json.dumps(data["data_config"], ensure_ascii=False, indent=2)
     lines = [
@@ -633,13 +691,70 @@ def render_js(data: Dict[str, Any]) -> str:
         "",
         f"const DATA_CONFIG = {data_config_json};",
         "",
+    ]
+    if detail_index is not None:
+        detail_index_json = json.dumps(detail_index, ensure_ascii=False, indent=2)
+        lines.extend([f"const DETAIL_INDEX = {detail_index_json};", ""])
+    lines.extend([
         "const COUNTRY_BY_ISO = new Map(Object.entries(DATA_CONFIG.countries));",
         "const CONTINENT_LIST = Object.keys(DATA_CONFIG.continents);",
         "",
+    ])
+    return "\n".join(lines)
+
+
+def render_detail_bucket_js(bucket: str, records: Dict[str, Any]) -> str:
+    records_json = json.dumps(records, ensure_ascii=False, separators=(",", ":"))
+    lines = [
+        "// Auto-generated by tools/xlsx_to_datajs.py – DO NOT EDIT",
+        f"(window.DETAIL_BUCKETS = window.DETAIL_BUCKETS || {{}})[{json.dumps(bucket)}] = {records_json};",
+        "",
     ]
     return "\n".join(lines)
 
 
+def write_detail_buckets(directory: Path, rendered: Dict[str, str]) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    for bucket, content in rendered.items():
+        write_output(directory / f"{bucket}.js", content)
+    for stale in directory.glob(f"{DETAIL_BUCKET_PREFIX}*.js"):
+        if stale.stem not in rendered:
+            stale.unlink()
+
+
+def default_detail_base_url(details_dir: Path, output_path: Path) -> str:
+    """Leitet den Pfad der Buckets relativ zu index.html ab.
+
+    Die Anwendung lädt `scripts/data.js`, der Seitenstamm ist daher das
+    Elternverzeichnis des Ordners, in dem die data.js liegt.
+    """
+
+    site_root = output_path.resolve().parent.parent
+    relative = os.path.relpath(details_dir.resolve(), site_root)
+    if relative == os.pardir or relative.startswith(os.pardir + os.sep):
+        raise ValueError(
+            f"'{details_dir}' liegt außerhalb des Seitenstamms '{site_root}'; bitte --detail-base-url angeben"
+        )
+    return Path(relative).as_posix().rstrip("/") + "/"
+
+
+def write_split_output(output_path: Path, data: Dict[str, Any], split: Dict[str, Any]) -> Tuple[int, int]:
+    """Schreibt die schlanke data.js und danach die Detail-Buckets laut `split`.
+
+    `split` enthält `directory`, `buckets` und `baseUrl`. Alle Inhalte werden
+    vorab erzeugt; die Buckets (samt Entfernen veralteter Dateien) werden erst
+    angefasst, wenn die data.js geschrieben ist. Zurückgegeben werden die Anzahl
+    der Detaildatensätze und der Buckets.
+    """
+
+    marker_data, buckets, index = split_point_details(data, split["buckets"])
+    content = render_js(marker_data, {"baseUrl": split["baseUrl"], "points": index})
+    rendered = {bucket: render_detail_bucket_js(bucket, records) for bucket, records in buckets.items()}
+    write_output(output_path, content)
+    write_detail_buckets(Path(split["directory"]), rendered)
+    return len(index), len(buckets)
+
+
 def write_output(path: Path, content: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8", newline="\n") as handle:
@@ -666,6 +781,28 @@ def parse_arguments(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Nur Validierung durchführen, keine Datei schreiben",
     )
+    parser.add_argument(
+        "--split-details",
+        metavar="VERZEICHNIS",
+        help="Detaildaten der Marker in nachladbare Bucket-Dateien in diesem Verzeichnis auslagern",
+    )
+    parser.add_argument(
+        "--detail-buckets",
+        type=int,
+        default=DETAIL_BUCKET_COUNT_DEFAULT,
+        metavar="ANZAHL",
+        help=f"Anzahl der Detail-Buckets (Standard: {DETAIL_BUCKET_COUNT_DEFAULT})",
+    )
+    parser.add_argument(
+        "--detail-base-url",
+        metavar="URL",
+        help="Pfad der Bucket-Dateien relativ zu index.html (Standard: aus --split-details und --output abgeleitet)",
+    )
+    parser.add_argument(
+        "--archive",
+        metavar="VERZEICHNIS",
+        help="Erfolgreichen Build zusätzlich im Snapshot-Archiv in diesem Verzeichnis ablegen",
+    )
     return parser.parse_args(argv)
 
 
@@ -676,6 +813,10 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         log("ERROR", "--output ist erforderlich, wenn nicht --check-only genutzt wird")
         return 2
 
+    if args.detail_buckets < 1:
+        log("ERROR", "--detail-buckets muss mindestens 1 sein")
+        return 2
+
     try:
         if args.xlsx:
             source_path = Path(args.xlsx)
@@ -705,14 +846,48 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         return 0
 
     output_path = Path(args.output)
+    split: Optional[Dict[str, Any]] = None
+    if args.split_details:
+        details_dir = Path(args.split_details)
+        try:
+            base_url = (
+                args.detail_base_url.rstrip("/") + "/"
+                if args.detail_base_url
+                else default_detail_base_url(details_dir, output_path)
+            )
+        except ValueError as exc:
+            log("ERROR", str(exc))
+            return 2
+        split = {
+            "directory": details_dir.as_posix(),
+            "buckets": args.detail_buckets,
+            "baseUrl": base_url,
+        }
     try:
-        content = render_js(data)
-        write_output(output_path, content)
+        if split:
+            record_count, bucket_count = write_split_output(output_path, data, split)
+        else:
+            write_output(output_path, render_js(data))
     except Exception as exc:  # noqa: BLE001
         log("ERROR", f"Ausgabe konnte nicht geschrieben werden: {exc}")
         return 3
 
+    if split:
+        log("INFO", f"{record_count} Detaildatensätze in {bucket_count} Buckets unter '{split['directory']}' abgelegt.")
     log("INFO", f"Datei '{output_path}' aktualisiert.")
+
+    if args.archive:
+        from datajs_archive import archive_build
+
+        try:
+            version_id, created = archive_build(Path(args.archive), data, source_description, split)
+        except Exception as exc:  # noqa: BLE001
+            log("ERROR", f"Archivierung fehlgeschlagen: {exc}")
+            return 3
+        if created:
+            log("INFO", f"Version {version_id[:12]} im Archiv '{args.archive}' abgelegt.")
+        else:
+            log("INFO", f"Daten unverändert, Archiv enthält bereits Version {version_id[:12]}.")
     return 0
 
 